@@ -24,6 +24,7 @@ def load(
     event_types: Optional[List[str]] = None,
     coordinates: Optional[str] = None,
     event_factory: Optional[EventFactory] = None,
+    include_raw_event: Optional[bool] = True,
 ) -> EventDataset:
     """
     Load StatsBomb event data into a [`EventDataset`][kloppy.domain.models.event.EventDataset]
@@ -35,6 +36,8 @@ def load(
         event_types:
         coordinates:
         event_factory:
+        include_raw_event: keep the json of each event in `raw_event`.
+            Set to False to reduce memory usage.
     """
     deserializer = StatsBombDeserializer(
         event_types=event_types,
@@ -42,6 +45,7 @@ def load(
         event_factory=event_factory
         or get_config("event_factory")
         or StatsBombEventFactory(),
+        include_raw_event=include_raw_event,
     )
     with open_as_file(event_data) as event_data_fp, open_as_file(
         lineup_data
@@ -62,6 +66,7 @@ def load_open_data(
     event_types: Optional[List[str]] = None,
     coordinates: Optional[str] = None,
     event_factory: Optional[EventFactory] = None,
+    include_raw_event: Optional[bool] = True,
 ) -> EventDataset:
     warnings.warn(
         "\n\nYou are about to use StatsBomb public data."
@@ -80,4 +85,5 @@ def load_open_data(
         event_types=event_types,
         coordinates=coordinates,
         event_factory=event_factory,
+        include_raw_event=include_raw_event,
     )
@@ -430,7 +430,7 @@ class Event(DataRecord, ABC):
 
     result: Optional[ResultType]
 
-    raw_event: Dict
+    raw_event: Optional[Dict]
     state: Dict[str, Any]
     related_event_ids: List[str]
 
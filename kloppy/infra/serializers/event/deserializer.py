@@ -39,9 +39,16 @@ class EventDataDeserializer(ABC, Generic[T]):
         self.event_factory = event_factory
 
     def should_include_event(self, event: Event) -> bool:
+        return self.should_include_event_type(event.event_type)
+
+    def should_include_event_type(self, event_type: EventType) -> bool:
+        """
+        Check if events of `event_type` can be included. Deserializers can
+        use this to skip building events that would be filtered out anyway.
+        """
         if not self.event_types:
             return True
-        return event.event_type in self.event_types
+        return event_type in self.event_types
 
     def get_transformer(
         self, length: float, width: float, provider: Optional[Provider] = None
@@ -1,9 +1,23 @@
-from typing import Tuple, Dict, List, NamedTuple, IO, Optional
+from typing import (
+    Tuple,
+    Dict,
+    List,
+    NamedTuple,
+    IO,
+    Optional,
+    Callable,
+    Union,
+)
 import logging
-import json
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from kloppy.domain import (
     EventDataset,
+    EventFactory,
     Team,
     Period,
     Point,
@@ -37,6 +51,7 @@ from kloppy.domain.models.event import (
     PassType,
     EventType,
     Event,
+    Qualifier,
 )
 from kloppy.exceptions import DeserializationError
 from kloppy.utils import performance_logging
@@ -105,6 +120,14 @@ SB_EVENT_TYPE_GOAL_KICK = 63
 
 OUT_EVENT_RESULTS = [PassResult.OUT, TakeOnResult.OUT]
 
+XY_FIDELITY_EVENT_TYPES = (
+    SB_EVENT_TYPE_CARRY,
+    SB_EVENT_TYPE_DRIBBLE,
+    SB_EVENT_TYPE_PASS,
+)
+
+AERIAL_WON_TYPE_NAMES = ("shot", "clearance", "miscontrol", "pass")
+
 SB_BODYPART_BOTH_HANDS = 35
 SB_BODYPART_CHEST = 36
 SB_BODYPART_HEAD = 37
@@ -121,6 +144,71 @@ SB_TECHNIQUE_THROUGH_BALL = 108
 
 FREEZE_FRAME_FPS = 25
 
+# Half the cell side of a location for each fidelity version: version 1
+# uses cells of 1.0 and version 2 uses cells of 0.1
+cell_relative_centers = {1: 1.0 / 2, 2: 0.1 / 2}
+
+body_parts = {
+    SB_BODYPART_BOTH_HANDS: BodyPart.BOTH_HANDS,
+    SB_BODYPART_CHEST: BodyPart.CHEST,
+    SB_BODYPART_HEAD: BodyPart.HEAD,
+    SB_BODYPART_LEFT_FOOT: BodyPart.LEFT_FOOT,
+    SB_BODYPART_LEFT_HAND: BodyPart.LEFT_HAND,
+    SB_BODYPART_RIGHT_FOOT: BodyPart.RIGHT_FOOT,
+    SB_BODYPART_RIGHT_HAND: BodyPart.RIGHT_HAND,
+    SB_BODYPART_DROP_KICK: BodyPart.DROP_KICK,
+    SB_BODYPART_KEEPER_ARM: BodyPart.KEEPER_ARM,
+    SB_BODYPART_OTHER: BodyPart.OTHER,
+    SB_BODYPART_NO_TOUCH: BodyPart.NO_TOUCH,
+}
+
+# Qualifiers are only read after deserialization, so all events of the same
+# set piece type can share one qualifier instance
+set_piece_type_qualifiers = {
+    SB_EVENT_TYPE_CORNER_KICK: SetPieceQualifier(
+        value=SetPieceType.CORNER_KICK
+    ),
+    SB_EVENT_TYPE_FREE_KICK: SetPieceQualifier(value=SetPieceType.FREE_KICK),
+    SB_EVENT_TYPE_PENALTY: SetPieceQualifier(value=SetPieceType.PENALTY),
+    SB_EVENT_TYPE_THROW_IN: SetPieceQualifier(value=SetPieceType.THROW_IN),
+    SB_EVENT_TYPE_KICK_OFF: SetPieceQualifier(value=SetPieceType.KICK_OFF),
+    SB_EVENT_TYPE_GOAL_KICK: SetPieceQualifier(value=SetPieceType.GOAL_KICK),
+}
+
+pass_results = {
+    SB_PASS_OUTCOME_OUT: PassResult.OUT,
+    SB_PASS_OUTCOME_INCOMPLETE: PassResult.INCOMPLETE,
+    SB_PASS_OUTCOME_OFFSIDE: PassResult.OFFSIDE,
+    SB_PASS_OUTCOME_INJURY_CLEARANCE: PassResult.OUT,
+    SB_PASS_OUTCOME_UNKNOWN: None,
+}
+
+shot_results = {
+    SB_SHOT_OUTCOME_OFF_TARGET: ShotResult.OFF_TARGET,
+    SB_SHOT_OUTCOME_SAVED: ShotResult.SAVED,
+    SB_SHOT_OUTCOME_SAVED_OFF_TARGET: ShotResult.SAVED,
+    SB_SHOT_OUTCOME_SAVED_TO_POST: ShotResult.SAVED,
+    SB_SHOT_OUTCOME_POST: ShotResult.POST,
+    SB_SHOT_OUTCOME_OFF_WAYWARD: ShotResult.OFF_TARGET,
+    SB_SHOT_OUTCOME_BLOCKED: ShotResult.BLOCKED,
+    SB_SHOT_OUTCOME_GOAL: ShotResult.GOAL,
+}
+
+take_on_results = {
+    SB_PASS_OUTCOME_OUT: TakeOnResult.OUT,
+    SB_PASS_OUTCOME_INCOMPLETE: TakeOnResult.INCOMPLETE,
+    SB_PASS_OUTCOME_COMPLETE: TakeOnResult.COMPLETE,
+}
+
+card_types = {
+    5: CardType.RED,
+    65: CardType.RED,
+    6: CardType.SECOND_YELLOW,
+    66: CardType.SECOND_YELLOW,
+    7: CardType.FIRST_YELLOW,
+    67: CardType.FIRST_YELLOW,
+}
+
 formations = {
     3142: FormationType.THREE_ONE_FOUR_TWO,
     312112: FormationType.THREE_ONE_TWO_ONE_ONE_TWO,
@@ -172,8 +260,7 @@ def _parse_coordinates(
     # +-----+------+
     # | 1,2 | 2,2  |
     # +-----+------+
-    cell_side = 0.1 if fidelity_version == 2 else 1.0
-    cell_relative_center = cell_side / 2
+    cell_relative_center = cell_relative_centers[fidelity_version]
     return Point(
         x=coordinates[0] - cell_relative_center,
         y=coordinates[1] - cell_relative_center,
@@ -186,29 +273,9 @@ def _get_body_part_qualifiers(
     qualifiers = []
     if "body_part" in event_type_dict:
         body_part_id = event_type_dict["body_part"]["id"]
-        if body_part_id == SB_BODYPART_BOTH_HANDS:
-            body_part = BodyPart.BOTH_HANDS
-        elif body_part_id == SB_BODYPART_CHEST:
-            body_part = BodyPart.CHEST
-        elif body_part_id == SB_BODYPART_HEAD:
-            body_part = BodyPart.HEAD
-        elif body_part_id == SB_BODYPART_LEFT_FOOT:
-            body_part = BodyPart.LEFT_FOOT
-        elif body_part_id == SB_BODYPART_LEFT_HAND:
-            body_part = BodyPart.LEFT_HAND
-        elif body_part_id == SB_BODYPART_RIGHT_FOOT:
-            body_part = BodyPart.RIGHT_FOOT
-        elif body_part_id == SB_BODYPART_RIGHT_HAND:
-            body_part = BodyPart.RIGHT_HAND
-        elif body_part_id == SB_BODYPART_DROP_KICK:
-            body_part = BodyPart.DROP_KICK
-        elif body_part_id == SB_BODYPART_KEEPER_ARM:
-            body_part = BodyPart.KEEPER_ARM
-        elif body_part_id == SB_BODYPART_OTHER:
-            body_part = BodyPart.OTHER
-        elif body_part_id == SB_BODYPART_NO_TOUCH:
-            body_part = BodyPart.NO_TOUCH
-        else:
+        try:
+            body_part = body_parts[body_part_id]
+        except KeyError:
             raise DeserializationError(f"Unknown body part: {body_part_id}")
         qualifiers.append(BodyPartQualifier(value=body_part))
     return qualifiers
@@ -254,52 +321,35 @@ def _get_pass_qualifiers(pass_dict: Dict) -> List[PassQualifier]:
 def _get_set_piece_qualifiers(pass_dict: Dict) -> List[SetPieceQualifier]:
     qualifiers = []
     if "type" in pass_dict:
-        type_id = pass_dict["type"]["id"]
-        set_piece_type = None
-        if type_id == SB_EVENT_TYPE_CORNER_KICK:
-            set_piece_type = SetPieceType.CORNER_KICK
-        elif type_id == SB_EVENT_TYPE_FREE_KICK:
-            set_piece_type = SetPieceType.FREE_KICK
-        elif type_id == SB_EVENT_TYPE_PENALTY:
-            set_piece_type = SetPieceType.PENALTY
-        elif type_id == SB_EVENT_TYPE_THROW_IN:
-            set_piece_type = SetPieceType.THROW_IN
-        elif type_id == SB_EVENT_TYPE_KICK_OFF:
-            set_piece_type = SetPieceType.KICK_OFF
-        elif type_id == SB_EVENT_TYPE_GOAL_KICK:
-            set_piece_type = SetPieceType.GOAL_KICK
-        if set_piece_type:
-            qualifiers.append(SetPieceQualifier(value=set_piece_type))
+        set_piece_qualifier = set_piece_type_qualifiers.get(
+            pass_dict["type"]["id"]
+        )
+        if set_piece_qualifier:
+            qualifiers.append(set_piece_qualifier)
     return qualifiers
 
 
-def _parse_pass(pass_dict: Dict, team: Team, fidelity_version: int) -> Dict:
+def _parse_pass(
+    pass_dict: Dict, players: Dict[int, Player], fidelity_version: int
+) -> Tuple[Optional[PassResult], Point, Optional[Player], List[Qualifier]]:
     if "outcome" in pass_dict:
         outcome_id = pass_dict["outcome"]["id"]
-        if outcome_id == SB_PASS_OUTCOME_OUT:
-            result = PassResult.OUT
-        elif outcome_id == SB_PASS_OUTCOME_INCOMPLETE:
-            result = PassResult.INCOMPLETE
-        elif outcome_id == SB_PASS_OUTCOME_OFFSIDE:
-            result = PassResult.OFFSIDE
-        elif outcome_id == SB_PASS_OUTCOME_INJURY_CLEARANCE:
-            result = PassResult.OUT
-        elif outcome_id == SB_PASS_OUTCOME_UNKNOWN:
-            result = None
-        else:
+        try:
+            result = pass_results[outcome_id]
+        except KeyError:
             raise DeserializationError(f"Unknown pass outcome: {outcome_id}")
 
         receiver_player = None
     else:
         result = PassResult.COMPLETE
-        receiver_player = team.get_player_by_id(pass_dict["recipient"]["id"])
+        receiver_player = players.get(pass_dict["recipient"]["id"])
 
     receiver_coordinates = _parse_coordinates(
         pass_dict["end_location"],
         fidelity_version,
     )
 
-    qualifiers = []
+    qualifiers: List[Qualifier] = []
     pass_qualifiers = _get_pass_qualifiers(pass_dict)
     qualifiers.extend(pass_qualifiers)
     set_piece_qualifiers = _get_set_piece_qualifiers(pass_dict)
@@ -307,40 +357,21 @@ def _parse_pass(pass_dict: Dict, team: Team, fidelity_version: int) -> Dict:
     body_part_qualifiers = _get_body_part_qualifiers(pass_dict)
     qualifiers.extend(body_part_qualifiers)
 
-    return {
-        "result": result,
-        "receiver_coordinates": receiver_coordinates,
-        "receiver_player": receiver_player,
-        "qualifiers": qualifiers,
-    }
+    return result, receiver_coordinates, receiver_player, qualifiers
 
 
-def _parse_shot(shot_dict: Dict) -> Dict:
+def _parse_shot(shot_dict: Dict) -> Tuple[ShotResult, List[Qualifier]]:
     outcome_id = shot_dict["outcome"]["id"]
-    if outcome_id == SB_SHOT_OUTCOME_OFF_TARGET:
-        result = ShotResult.OFF_TARGET
-    elif outcome_id == SB_SHOT_OUTCOME_SAVED:
-        result = ShotResult.SAVED
-    elif outcome_id == SB_SHOT_OUTCOME_SAVED_OFF_TARGET:
-        result = ShotResult.SAVED
-    elif outcome_id == SB_SHOT_OUTCOME_SAVED_TO_POST:
-        result = ShotResult.SAVED
-    elif outcome_id == SB_SHOT_OUTCOME_POST:
-        result = ShotResult.POST
-    elif outcome_id == SB_SHOT_OUTCOME_OFF_WAYWARD:
-        result = ShotResult.OFF_TARGET
-    elif outcome_id == SB_SHOT_OUTCOME_BLOCKED:
-        result = ShotResult.BLOCKED
-    elif outcome_id == SB_SHOT_OUTCOME_GOAL:
-        result = ShotResult.GOAL
-    else:
+    try:
+        result = shot_results[outcome_id]
+    except KeyError:
         raise DeserializationError(f"Unknown shot outcome: {outcome_id}")
 
-    qualifiers = []
+    qualifiers: List[Qualifier] = []
     body_part_qualifiers = _get_body_part_qualifiers(shot_dict)
     qualifiers.extend(body_part_qualifiers)
 
-    return {"result": result, "qualifiers": qualifiers}
+    return result, qualifiers
 
 
 def _parse_freeze_frame(
@@ -402,17 +433,18 @@ def _parse_freeze_frame(
     )
 
 
-def _parse_carry(carry_dict: Dict, fidelity_version: int) -> Dict:
-    return {
-        "result": CarryResult.COMPLETE,
-        "end_coordinates": _parse_coordinates(
-            carry_dict["end_location"],
-            fidelity_version,
-        ),
-    }
+def _parse_carry(
+    carry_dict: Dict, fidelity_version: int
+) -> Tuple[CarryResult, Point]:
+    return CarryResult.COMPLETE, _parse_coordinates(
+        carry_dict["end_location"],
+        fidelity_version,
+    )
 
 
-def _parse_clearance(raw_event: Dict, events: List) -> Dict:
+def _parse_clearance(
+    raw_event: Dict, events: List[Event]
+) -> List[BodyPartQualifier]:
     qualifiers = []
     if "related_events" in raw_event:
         for event in events[-20:][::-1]:
@@ -428,36 +460,30 @@ def _parse_clearance(raw_event: Dict, events: List) -> Dict:
                 qualifiers.extend(body_part_qualifiers)
                 break
 
-    return {"qualifiers": qualifiers}
+    return qualifiers
 
 
-def _parse_take_on(take_on_dict: Dict) -> Dict:
+def _parse_take_on(take_on_dict: Dict) -> TakeOnResult:
     if "outcome" in take_on_dict:
         outcome_id = take_on_dict["outcome"]["id"]
-        if outcome_id == SB_PASS_OUTCOME_OUT:
-            result = TakeOnResult.OUT
-        elif outcome_id == SB_PASS_OUTCOME_INCOMPLETE:
-            result = TakeOnResult.INCOMPLETE
-        elif outcome_id == SB_PASS_OUTCOME_COMPLETE:
-            result = TakeOnResult.COMPLETE
-        else:
+        try:
+            result = take_on_results[outcome_id]
+        except KeyError:
             raise DeserializationError(
                 f"Unknown pass outcome: {take_on_dict['outcome']['name']}({outcome_id})"
             )
     else:
         result = TakeOnResult.COMPLETE
 
-    return {
-        "result": result,
-    }
+    return result
 
 
 def _parse_duel(
-    raw_event: dict,
+    raw_event: Dict,
     event_type: int,
-) -> Dict:
-    duel_dict = None
-    duel_qualifiers = []
+) -> Tuple[DuelResult, List[Qualifier]]:
+    duel_dict = {}
+    duel_qualifiers: List[Qualifier] = []
 
     if event_type == SB_EVENT_TYPE_DUEL:
         duel_dict = raw_event.get("duel", {})
@@ -486,12 +512,14 @@ def _parse_duel(
         DuelResult.WON if outcome_name in DUEL_WON_NAMES else DuelResult.LOST
     )
 
-    return {"result": result, "qualifiers": qualifiers}
+    return result, qualifiers
 
 
-def _parse_aerial_won_duel(raw_event: dict, type_name: str) -> Dict:
+def _parse_aerial_won_duel(
+    raw_event: Dict, type_name: str
+) -> Tuple[DuelResult, List[Qualifier]]:
     aerial_won_dict = raw_event[type_name]
-    duel_qualifiers = [
+    duel_qualifiers: List[Qualifier] = [
         DuelQualifier(value=DuelType.LOOSE_BALL),
         DuelQualifier(value=DuelType.AERIAL),
     ]
@@ -499,61 +527,54 @@ def _parse_aerial_won_duel(raw_event: dict, type_name: str) -> Dict:
 
     result = DuelResult.WON
 
-    return {"result": result, "qualifiers": qualifiers}
+    return result, qualifiers
 
 
-def _parse_substitution(substitution_dict: Dict, team: Team) -> Dict:
-    replacement_player = None
-    for player in team.players:
-        if player.player_id == str(substitution_dict["replacement"]["id"]):
-            replacement_player = player
-            break
-    else:
+def _parse_substitution(
+    substitution_dict: Dict, players: Dict[int, Player]
+) -> Player:
+    replacement_player = players.get(substitution_dict["replacement"]["id"])
+    if replacement_player is None:
         raise DeserializationError(
             f'Could not find replacement player {substitution_dict["replacement"]["id"]}'
         )
 
-    return {
-        "replacement_player": replacement_player,
-    }
+    return replacement_player
 
 
-def _parse_bad_behaviour(bad_behaviour_dict: Dict) -> Dict:
-    bad_behaviour = {}
+def _parse_bad_behaviour(bad_behaviour_dict: Dict) -> Optional[CardType]:
+    card_type = None
     if "card" in bad_behaviour_dict:
-        bad_behaviour["card"] = _parse_card(bad_behaviour_dict["card"])
+        card_type = _parse_card(bad_behaviour_dict["card"])
 
-    return bad_behaviour
+    return card_type
 
 
-def _parse_foul_committed(foul_committed_dict: Dict) -> Dict:
-    foul_committed = {}
+def _parse_foul_committed(foul_committed_dict: Dict) -> Optional[CardType]:
+    card_type = None
     if "card" in foul_committed_dict:
-        foul_committed["card"] = _parse_card(foul_committed_dict["card"])
+        card_type = _parse_card(foul_committed_dict["card"])
 
-    return foul_committed
+    return card_type
 
 
-def _parse_card(card_dict: Dict) -> Dict:
+def _parse_card(card_dict: Dict) -> CardType:
     card_id = card_dict["id"]
-    if card_id in (5, 65):
-        card_type = CardType.RED
-    elif card_id in (6, 66):
-        card_type = CardType.SECOND_YELLOW
-    elif card_id in (7, 67):
-        card_type = CardType.FIRST_YELLOW
-    else:
+    try:
+        card_type = card_types[card_id]
+    except KeyError:
         raise DeserializationError(f"Unknown card id {card_id}")
 
-    return {
-        "card_type": card_type,
-    }
+    return card_type
 
 
-def _parse_formation_change(formation_id: int) -> Dict:
-    formation = formations[formation_id]
+def _parse_formation_change(formation_id: int) -> FormationType:
+    return formations[formation_id]
 
-    return dict(formation_type=formation)
+
+def _has_fractional_location(event: Dict) -> bool:
+    x, y, *_ = event["location"]
+    return not x.is_integer() or not y.is_integer()
 
 
 def _determine_xy_fidelity_versions(events: List[Dict]) -> Tuple[int, int]:
@@ -563,22 +584,347 @@ def _determine_xy_fidelity_versions(events: List[Dict]) -> Tuple[int, int]:
     shot_fidelity_version = 1
     xy_fidelity_version = 1
     for event in events:
-        if "location" in event:
-            x, y, *_ = event["location"]
+        if "location" not in event:
+            continue
+
+        # Only do the float check for event types that determine a version
+        # that is not known yet. Once both versions are found we can stop.
+        event_type = event["type"]["id"]
+        if event_type == SB_EVENT_TYPE_SHOT:
+            if shot_fidelity_version == 1 and _has_fractional_location(event):
+                shot_fidelity_version = 2
+        elif event_type in XY_FIDELITY_EVENT_TYPES:
+            if xy_fidelity_version == 1 and _has_fractional_location(event):
+                xy_fidelity_version = 2
+        else:
+            continue
 
-            if not x.is_integer() or not y.is_integer():
-                event_type = event["type"]["id"]
-                if event_type == SB_EVENT_TYPE_SHOT:
-                    shot_fidelity_version = 2
-                elif event_type in (
-                    SB_EVENT_TYPE_CARRY,
-                    SB_EVENT_TYPE_DRIBBLE,
-                    SB_EVENT_TYPE_PASS,
-                ):
-                    xy_fidelity_version = 2
+        if shot_fidelity_version == 2 and xy_fidelity_version == 2:
+            break
     return shot_fidelity_version, xy_fidelity_version
 
 
+def _handle_pass(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    result, receiver_coordinates, receiver_player, qualifiers = _parse_pass(
+        pass_dict=raw_event["pass"],
+        players=players,
+        fidelity_version=fidelity_version,
+    )
+    pass_event = event_factory.build_pass(
+        result=result,
+        receive_timestamp=generic_event_kwargs["timestamp"]
+        + raw_event.get("duration", 0.0),
+        receiver_coordinates=receiver_coordinates,
+        receiver_player=receiver_player,
+        qualifiers=qualifiers,
+        **generic_event_kwargs,
+    )
+    return (pass_event,)
+
+
+def _handle_shot(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    result, qualifiers = _parse_shot(
+        shot_dict=raw_event["shot"],
+    )
+    shot_event = event_factory.build_shot(
+        result=result,
+        qualifiers=qualifiers,
+        **generic_event_kwargs,
+    )
+    return (shot_event,)
+
+
+def _handle_clearance(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    qualifiers = _parse_clearance(raw_event=raw_event, events=events)
+    clearance_event = event_factory.build_clearance(
+        result=None,
+        qualifiers=qualifiers,
+        **generic_event_kwargs,
+    )
+    return (clearance_event,)
+
+
+# For dribble and carry the definitions
+# are flipped between StatsBomb and kloppy
+def _handle_dribble(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    result = _parse_take_on(
+        take_on_dict=raw_event["dribble"],
+    )
+    take_on_event = event_factory.build_take_on(
+        result=result,
+        qualifiers=None,
+        **generic_event_kwargs,
+    )
+    return (take_on_event,)
+
+
+def _handle_carry(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    result, end_coordinates = _parse_carry(
+        carry_dict=raw_event["carry"],
+        fidelity_version=fidelity_version,
+    )
+    carry_event = event_factory.build_carry(
+        result=result,
+        qualifiers=None,
+        # TODO: Consider moving this to _parse_carry
+        end_timestamp=generic_event_kwargs["timestamp"]
+        + raw_event.get("duration", 0),
+        end_coordinates=end_coordinates,
+        **generic_event_kwargs,
+    )
+    return (carry_event,)
+
+
+def _handle_duel(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    result, qualifiers = _parse_duel(
+        raw_event=raw_event, event_type=raw_event["type"]["id"]
+    )
+    duel_event = event_factory.build_duel(
+        result=result,
+        qualifiers=qualifiers,
+        **generic_event_kwargs,
+    )
+    return (duel_event,)
+
+
+def _handle_substitution(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    replacement_player = _parse_substitution(
+        substitution_dict=raw_event["substitution"],
+        players=players,
+    )
+    substitution_event = event_factory.build_substitution(
+        result=None,
+        qualifiers=None,
+        replacement_player=replacement_player,
+        **generic_event_kwargs,
+    )
+    return (substitution_event,)
+
+
+def _handle_bad_behaviour(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    card_type = _parse_bad_behaviour(
+        bad_behaviour_dict=raw_event.get("bad_behaviour", {}),
+    )
+    if card_type is None:
+        return ()
+
+    card_event = event_factory.build_card(
+        result=None,
+        qualifiers=None,
+        card_type=card_type,
+        **generic_event_kwargs,
+    )
+    return (card_event,)
+
+
+def _handle_foul_committed(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    card_type = _parse_foul_committed(
+        foul_committed_dict=raw_event.get("foul_committed", {}),
+    )
+    foul_committed_event = event_factory.build_foul_committed(
+        result=None,
+        qualifiers=None,
+        **generic_event_kwargs,
+    )
+    if card_type is None:
+        return (foul_committed_event,)
+
+    card_event = event_factory.build_card(
+        result=None,
+        qualifiers=None,
+        card_type=card_type,
+        **generic_event_kwargs,
+    )
+    return foul_committed_event, card_event
+
+
+def _handle_player_on(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    player_on_event = event_factory.build_player_on(
+        result=None,
+        qualifiers=None,
+        **generic_event_kwargs,
+    )
+    return (player_on_event,)
+
+
+def _handle_player_off(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    player_off_event = event_factory.build_player_off(
+        result=None,
+        qualifiers=None,
+        **generic_event_kwargs,
+    )
+    return (player_off_event,)
+
+
+def _handle_recovery(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    recovery_event = event_factory.build_recovery(
+        result=None,
+        qualifiers=None,
+        **generic_event_kwargs,
+    )
+    return (recovery_event,)
+
+
+def _handle_formation_change(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    formation_type = _parse_formation_change(raw_event["tactics"]["formation"])
+    formation_change_event = event_factory.build_formation_change(
+        result=None,
+        qualifiers=None,
+        formation_type=formation_type,
+        **generic_event_kwargs,
+    )
+    return (formation_change_event,)
+
+
+def _handle_generic(
+    event_factory: EventFactory,
+    raw_event: Dict,
+    generic_event_kwargs: Dict,
+    fidelity_version: int,
+    players: Dict[int, Player],
+    events: List[Event],
+) -> Tuple[Event, ...]:
+    generic_event = event_factory.build_generic(
+        result=None,
+        qualifiers=None,
+        event_name=raw_event["type"]["name"],
+        **generic_event_kwargs,
+    )
+    return (generic_event,)
+
+
+# StatsBomb event types that are not in here are deserialized
+# as a GenericEvent by _handle_generic
+event_handlers: Dict[int, Callable[..., Tuple[Event, ...]]] = {
+    SB_EVENT_TYPE_PASS: _handle_pass,
+    SB_EVENT_TYPE_SHOT: _handle_shot,
+    SB_EVENT_TYPE_CLEARANCE: _handle_clearance,
+    SB_EVENT_TYPE_DRIBBLE: _handle_dribble,
+    SB_EVENT_TYPE_CARRY: _handle_carry,
+    SB_EVENT_TYPE_DUEL: _handle_duel,
+    SB_EVENT_TYPE_50_50: _handle_duel,
+    # lineup affecting events
+    SB_EVENT_TYPE_SUBSTITUTION: _handle_substitution,
+    SB_EVENT_TYPE_BAD_BEHAVIOUR: _handle_bad_behaviour,
+    SB_EVENT_TYPE_FOUL_COMMITTED: _handle_foul_committed,
+    SB_EVENT_TYPE_PLAYER_ON: _handle_player_on,
+    SB_EVENT_TYPE_PLAYER_OFF: _handle_player_off,
+    SB_EVENT_TYPE_RECOVERY: _handle_recovery,
+    SB_EVENT_TYPE_FORMATION_CHANGE: _handle_formation_change,
+}
+
+# kloppy event types each StatsBomb event type can result in. This includes
+# the aerial won duels and synthetic ball out events added in the event loop.
+generic_event_types = (EventType.GENERIC, EventType.DUEL)
+event_handler_event_types: Dict[int, Tuple[EventType, ...]] = {
+    SB_EVENT_TYPE_PASS: (EventType.PASS, EventType.DUEL, EventType.BALL_OUT),
+    SB_EVENT_TYPE_SHOT: (EventType.SHOT, EventType.DUEL),
+    SB_EVENT_TYPE_CLEARANCE: (EventType.CLEARANCE, EventType.DUEL),
+    SB_EVENT_TYPE_DRIBBLE: (EventType.TAKE_ON, EventType.BALL_OUT),
+    SB_EVENT_TYPE_CARRY: (EventType.CARRY,),
+    SB_EVENT_TYPE_DUEL: (EventType.DUEL,),
+    SB_EVENT_TYPE_50_50: (EventType.DUEL,),
+    SB_EVENT_TYPE_SUBSTITUTION: (EventType.SUBSTITUTION,),
+    SB_EVENT_TYPE_BAD_BEHAVIOUR: (EventType.CARD,),
+    SB_EVENT_TYPE_FOUL_COMMITTED: (EventType.FOUL_COMMITTED, EventType.CARD),
+    SB_EVENT_TYPE_PLAYER_ON: (EventType.PLAYER_ON,),
+    SB_EVENT_TYPE_PLAYER_OFF: (EventType.PLAYER_OFF,),
+    SB_EVENT_TYPE_RECOVERY: (EventType.RECOVERY,),
+    SB_EVENT_TYPE_FORMATION_CHANGE: (EventType.FORMATION_CHANGE,),
+}
+
+
 class StatsBombInputs(NamedTuple):
     event_data: IO[bytes]
     lineup_data: IO[bytes]
@@ -586,6 +932,16 @@ class StatsBombInputs(NamedTuple):
 
 
 class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
+    def __init__(
+        self,
+        event_types: Optional[List[Union[EventType, str]]] = None,
+        coordinate_system: Optional[Union[str, Provider]] = None,
+        event_factory: Optional[EventFactory] = None,
+        include_raw_event: Optional[bool] = True,
+    ):
+        super().__init__(event_types, coordinate_system, event_factory)
+        self.include_raw_event = include_raw_event
+
     @property
     def provider(self) -> Provider:
         return Provider.STATSBOMB
@@ -594,8 +950,8 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
         transformer = self.get_transformer(length=120, width=80)
 
         with performance_logging("load data", logger=logger):
-            raw_events = json.load(inputs.event_data)
-            lineups = json.load(inputs.lineup_data)
+            raw_events = json_loads(inputs.event_data.read())
+            lineups = json_loads(inputs.lineup_data.read())
 
             # First event (Starting-XI) determines home team
             if raw_events[0]["team"]["id"] == lineups[0]["team_id"]:
@@ -606,7 +962,7 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
             if inputs.three_sixty_data:
                 three_sixty_data = {
                     item["event_uuid"]: item
-                    for item in json.load(inputs.three_sixty_data)
+                    for item in json_loads(inputs.three_sixty_data.read())
                 }
             else:
                 three_sixty_data = {}
@@ -621,23 +977,26 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
 
         with performance_logging("parse data", logger=logger):
             player_positions = {}
+            starting_formations = {}
             for raw_event in raw_events:
                 if raw_event["type"]["id"] == SB_EVENT_TYPE_STARTING_XI:
-                    for player in raw_event["tactics"]["lineup"]:
-                        player_positions[
-                            str(player["player"]["id"])
-                        ] = Position(
-                            position_id=str(player["position"]["id"]),
-                            name=player["position"]["name"],
+                    tactics = raw_event["tactics"]
+                    starting_formations[
+                        raw_event["team"]["id"]
+                    ] = FormationType(
+                        "-".join(list(str(tactics["formation"])))
+                    )
+                    for player in tactics["lineup"]:
+                        position = player["position"]
+                        player_positions[player["player"]["id"]] = Position(
+                            position_id=str(position["id"]),
+                            name=position["name"],
                         )
 
-            starting_formations = {
-                raw_event["team"]["id"]: FormationType(
-                    "-".join(list(str(raw_event["tactics"]["formation"])))
-                )
-                for raw_event in raw_events
-                if raw_event["type"]["id"] == SB_EVENT_TYPE_STARTING_XI
-            }
+                    # There is one Starting XI event per team, all at the
+                    # start of the match
+                    if len(starting_formations) == len(lineups):
+                        break
 
             home_team = Team(
                 team_id=str(home_lineup["team_id"]),
@@ -645,17 +1004,20 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
                 ground=Ground.HOME,
                 starting_formation=starting_formations[home_lineup["team_id"]],
             )
-            home_team.players = [
-                Player(
+            # StatsBomb player ids are kept as int for lookups, only the
+            # Player itself gets the id as str
+            home_players = {
+                player["player_id"]: Player(
                     player_id=str(player["player_id"]),
                     team=home_team,
                     name=player["player_name"],
                     jersey_no=int(player["jersey_number"]),
-                    starting=str(player["player_id"]) in player_positions,
-                    position=player_positions.get(str(player["player_id"])),
+                    starting=player["player_id"] in player_positions,
+                    position=player_positions.get(player["player_id"]),
                 )
                 for player in home_lineup["lineup"]
-            ]
+            }
+            home_team.players = list(home_players.values())
 
             away_team = Team(
                 team_id=str(away_lineup["team_id"]),
@@ -663,44 +1025,52 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
                 ground=Ground.AWAY,
                 starting_formation=starting_formations[away_lineup["team_id"]],
             )
-            away_team.players = [
-                Player(
+            away_players = {
+                player["player_id"]: Player(
                     player_id=str(player["player_id"]),
                     team=away_team,
                     name=player["player_name"],
                     jersey_no=int(player["jersey_number"]),
-                    starting=str(player["player_id"]) in player_positions,
-                    position=player_positions.get(str(player["player_id"])),
+                    starting=player["player_id"] in player_positions,
+                    position=player_positions.get(player["player_id"]),
                 )
                 for player in away_lineup["lineup"]
-            ]
+            }
+            away_team.players = list(away_players.values())
 
             teams = [home_team, away_team]
+            players_by_team = {
+                home_team: home_players,
+                away_team: away_players,
+            }
 
             periods = []
             period = None
-            events = []
+            events: List[Event] = []
+            teams_by_id = {
+                home_lineup["team_id"]: home_team,
+                away_lineup["team_id"]: away_team,
+            }
+            event_factory = self.event_factory
+            transform_event = transformer.transform_event
+            # Per StatsBomb event type: can any of the resulting events be
+            # included? When not, we skip building them altogether.
+            include_event_type: Dict[int, bool] = {}
+            # Reused for every event. All keys are set again for each raw
+            # event, so changes made for a ball out event don't leak into
+            # the next one.
+            generic_event_kwargs: Dict = {}
             for raw_event in raw_events:
-                if raw_event["team"]["id"] == home_lineup["team_id"]:
-                    team = home_team
-                elif raw_event["team"]["id"] == away_lineup["team_id"]:
-                    team = away_team
-                else:
-                    raise DeserializationError(
-                        f"Unknown team_id {raw_event['team']['id']}"
-                    )
+                event_type = raw_event["type"]["id"]
+                team_id = raw_event["team"]["id"]
+                team = teams_by_id.get(team_id)
+                if team is None:
+                    raise DeserializationError(f"Unknown team_id {team_id}")
 
-                if (
+                possession_team = teams_by_id.get(
                     raw_event["possession_team"]["id"]
-                    == home_lineup["team_id"]
-                ):
-                    possession_team = home_team
-                elif (
-                    raw_event["possession_team"]["id"]
-                    == away_lineup["team_id"]
-                ):
-                    possession_team = away_team
-                else:
+                )
+                if possession_team is None:
                     raise DeserializationError(
                         f"Unknown possession_team_id: {raw_event['possession_team']}"
                     )
@@ -722,227 +1092,80 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
                 else:
                     period.end_timestamp = period.start_timestamp + timestamp
 
-                player = None
-                if "player" in raw_event:
-                    player = team.get_player_by_id(raw_event["player"]["id"])
-
-                event_type = raw_event["type"]["id"]
                 if event_type == SB_EVENT_TYPE_SHOT:
                     fidelity_version = shot_fidelity_version
-                elif event_type in (
-                    SB_EVENT_TYPE_CARRY,
-                    SB_EVENT_TYPE_DRIBBLE,
-                    SB_EVENT_TYPE_PASS,
-                ):
-                    fidelity_version = xy_fidelity_version
                 else:
-                    # TODO: Uh ohhhh.. don't know which one to pick
+                    # TODO: Uh ohhhh.. don't know which one to pick for
+                    # event types other than carry, dribble and pass
                     fidelity_version = xy_fidelity_version
 
-                generic_event_kwargs = {
-                    # from DataRecord
-                    "period": period,
-                    "timestamp": timestamp,
-                    "ball_owning_team": possession_team,
-                    "ball_state": BallState.ALIVE,
-                    # from Event
-                    "event_id": raw_event["id"],
-                    "team": team,
-                    "player": player,
-                    "coordinates": (
-                        _parse_coordinates(
-                            raw_event.get("location"),
-                            fidelity_version,
+                should_include = include_event_type.get(event_type)
+                if should_include is None:
+                    should_include = include_event_type[event_type] = any(
+                        self.should_include_event_type(kloppy_event_type)
+                        for kloppy_event_type in event_handler_event_types.get(
+                            event_type, generic_event_types
                         )
-                        if "location" in raw_event
-                        else None
-                    ),
-                    "related_event_ids": raw_event.get("related_events", []),
-                    "raw_event": raw_event,
-                }
-
-                new_events = []
-                if event_type == SB_EVENT_TYPE_PASS:
-                    pass_event_kwargs = _parse_pass(
-                        pass_dict=raw_event["pass"],
-                        team=team,
-                        fidelity_version=fidelity_version,
-                    )
-                    pass_event = self.event_factory.build_pass(
-                        receive_timestamp=timestamp
-                        + raw_event.get("duration", 0.0),
-                        **pass_event_kwargs,
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(pass_event)
-                elif event_type == SB_EVENT_TYPE_SHOT:
-                    shot_event_kwargs = _parse_shot(
-                        shot_dict=raw_event["shot"],
-                    )
-                    shot_event = self.event_factory.build_shot(
-                        **shot_event_kwargs,
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(shot_event)
-                elif event_type == SB_EVENT_TYPE_CLEARANCE:
-                    clearance_event_kwargs = _parse_clearance(
-                        raw_event=raw_event, events=events
-                    )
-                    clearance_event = self.event_factory.build_clearance(
-                        result=None,
-                        **clearance_event_kwargs,
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(clearance_event)
-                # For dribble and carry the definitions
-                # are flipped between StatsBomb and kloppy
-                elif event_type == SB_EVENT_TYPE_DRIBBLE:
-                    take_on_event_kwargs = _parse_take_on(
-                        take_on_dict=raw_event["dribble"],
-                    )
-                    take_on_event = self.event_factory.build_take_on(
-                        qualifiers=None,
-                        **take_on_event_kwargs,
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(take_on_event)
-                elif event_type == SB_EVENT_TYPE_CARRY:
-                    carry_event_kwargs = _parse_carry(
-                        carry_dict=raw_event["carry"],
-                        fidelity_version=fidelity_version,
-                    )
-                    carry_event = self.event_factory.build_carry(
-                        qualifiers=None,
-                        # TODO: Consider moving this to _parse_carry
-                        end_timestamp=timestamp + raw_event.get("duration", 0),
-                        **carry_event_kwargs,
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(carry_event)
-                elif event_type in [SB_EVENT_TYPE_DUEL, SB_EVENT_TYPE_50_50]:
-                    duel_event_kwargs = _parse_duel(
-                        raw_event=raw_event, event_type=event_type
-                    )
-                    duel_event = self.event_factory.build_duel(
-                        **duel_event_kwargs,
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(duel_event)
-
-                # lineup affecting events
-                elif event_type == SB_EVENT_TYPE_SUBSTITUTION:
-                    substitution_event_kwargs = _parse_substitution(
-                        substitution_dict=raw_event["substitution"],
-                        team=team,
-                    )
-                    substitution_event = self.event_factory.build_substitution(
-                        result=None,
-                        qualifiers=None,
-                        **substitution_event_kwargs,
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(substitution_event)
-                elif event_type == SB_EVENT_TYPE_BAD_BEHAVIOUR:
-                    bad_behaviour_kwargs = _parse_bad_behaviour(
-                        bad_behaviour_dict=raw_event.get("bad_behaviour", {}),
-                    )
-                    if "card" in bad_behaviour_kwargs:
-                        card_kwargs = bad_behaviour_kwargs["card"]
-                        card_event = self.event_factory.build_card(
-                            result=None,
-                            qualifiers=None,
-                            card_type=card_kwargs["card_type"],
-                            **generic_event_kwargs,
-                        )
-                        new_events.append(card_event)
-                elif event_type == SB_EVENT_TYPE_FOUL_COMMITTED:
-                    foul_committed_kwargs = _parse_foul_committed(
-                        foul_committed_dict=raw_event.get(
-                            "foul_committed", {}
-                        ),
                     )
-                    foul_committed_event = (
-                        self.event_factory.build_foul_committed(
-                            result=None,
-                            qualifiers=None,
-                            **generic_event_kwargs,
-                        )
-                    )
-                    new_events.append(foul_committed_event)
-                    if "card" in foul_committed_kwargs:
-                        card_kwargs = foul_committed_kwargs["card"]
-                        card_event = self.event_factory.build_card(
-                            result=None,
-                            qualifiers=None,
-                            card_type=card_kwargs["card_type"],
-                            **generic_event_kwargs,
-                        )
-                        new_events.append(card_event)
-                elif event_type == SB_EVENT_TYPE_PLAYER_ON:
-                    player_on_event = self.event_factory.build_player_on(
-                        result=None,
-                        qualifiers=None,
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(player_on_event)
-                elif event_type == SB_EVENT_TYPE_PLAYER_OFF:
-                    player_off_event = self.event_factory.build_player_off(
-                        result=None,
-                        qualifiers=None,
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(player_off_event)
-
-                elif event_type == SB_EVENT_TYPE_RECOVERY:
-                    recovery_event = self.event_factory.build_recovery(
-                        result=None,
-                        qualifiers=None,
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(recovery_event)
+                if not should_include:
+                    continue
 
-                elif event_type == SB_EVENT_TYPE_FORMATION_CHANGE:
-                    formation_change_event_kwargs = _parse_formation_change(
-                        raw_event["tactics"]["formation"]
-                    )
-                    formation_change_event = (
-                        self.event_factory.build_formation_change(
-                            result=None,
-                            qualifiers=None,
-                            **formation_change_event_kwargs,
-                            **generic_event_kwargs,
-                        )
-                    )
-                    new_events.append(formation_change_event)
-                # rest: generic
-                else:
-                    generic_event = self.event_factory.build_generic(
-                        result=None,
-                        qualifiers=None,
-                        event_name=raw_event["type"]["name"],
-                        **generic_event_kwargs,
-                    )
-                    new_events.append(generic_event)
+                team_players = players_by_team[team]
+                player = None
+                if "player" in raw_event:
+                    player = team_players.get(raw_event["player"]["id"])
+
+                location = raw_event.get("location")
+
+                # from DataRecord
+                generic_event_kwargs["period"] = period
+                generic_event_kwargs["timestamp"] = timestamp
+                generic_event_kwargs["ball_owning_team"] = possession_team
+                generic_event_kwargs["ball_state"] = BallState.ALIVE
+                # from Event
+                generic_event_kwargs["event_id"] = raw_event["id"]
+                generic_event_kwargs["team"] = team
+                generic_event_kwargs["player"] = player
+                generic_event_kwargs["coordinates"] = (
+                    _parse_coordinates(location, fidelity_version)
+                    if location is not None
+                    else None
+                )
+                generic_event_kwargs["related_event_ids"] = raw_event.get(
+                    "related_events", []
+                )
+                generic_event_kwargs["raw_event"] = raw_event
+
+                handler = event_handlers.get(event_type, _handle_generic)
+                new_events = handler(
+                    event_factory,
+                    raw_event,
+                    generic_event_kwargs,
+                    fidelity_version,
+                    team_players,
+                    events,
+                )
 
                 # Add possible aerial won - Applicable to multiple event types
-                for type_name in ["shot", "clearance", "miscontrol", "pass"]:
+                for type_name in AERIAL_WON_TYPE_NAMES:
                     if (
                         type_name in raw_event
                         and "aerial_won" in raw_event[type_name]
                     ):
-                        duel_event_kwargs = _parse_aerial_won_duel(
+                        result, qualifiers = _parse_aerial_won_duel(
                             raw_event=raw_event, type_name=type_name
                         )
-                        duel_event = self.event_factory.build_duel(
-                            **duel_event_kwargs,
+                        duel_event = event_factory.build_duel(
+                            result=result,
+                            qualifiers=qualifiers,
                             **generic_event_kwargs,
                         )
                         # add duel event as first event.
-                        new_events.insert(0, duel_event)
+                        new_events = (duel_event,) + new_events
 
                 for event in new_events:
                     if self.should_include_event(event):
-                        transformed_event = transformer.transform_event(event)
+                        transformed_event = transform_event(event)
                         events.append(transformed_event)
 
                     # Checks if the event ended out of the field and adds a synthetic out event
@@ -953,15 +1176,15 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
                                 "coordinates"
                             ] = event.receiver_coordinates
 
-                            ball_out_event = self.event_factory.build_ball_out(
+                            ball_out_event = event_factory.build_ball_out(
                                 result=None,
                                 qualifiers=None,
                                 **generic_event_kwargs,
                             )
 
                             if self.should_include_event(ball_out_event):
-                                transformed_ball_out_event = (
-                                    transformer.transform_event(ball_out_event)
+                                transformed_ball_out_event = transform_event(
+                                    ball_out_event
                                 )
                                 events.append(transformed_ball_out_event)
 
@@ -994,16 +1217,22 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
                     )
                 )
 
+            # The raw event is needed up to here for clearances and freeze
+            # frames. Drop it now so the parsed json can be freed.
+            if not self.include_raw_event:
+                event.raw_event = None
+
+        coordinate_system = transformer.get_to_coordinate_system()
         metadata = Metadata(
             teams=teams,
             periods=periods,
-            pitch_dimensions=transformer.get_to_coordinate_system().pitch_dimensions,
+            pitch_dimensions=coordinate_system.pitch_dimensions,
             frame_rate=None,
             orientation=Orientation.ACTION_EXECUTING_TEAM,
             flags=DatasetFlag.BALL_OWNING_TEAM,
             score=None,
             provider=Provider.STATSBOMB,
-            coordinate_system=transformer.get_to_coordinate_system(),
+            coordinate_system=coordinate_system,
         )
 
         return EventDataset(
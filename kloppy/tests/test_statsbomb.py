@@ -228,6 +228,53 @@ class TestStatsBomb:
 
         assert len(dataset.events) == 23
 
+    def test_event_types_filter(self, lineup_data: Path, event_data: Path):
+        """
+        Test that filtering on event types gives the same events as
+        filtering a fully loaded dataset
+        """
+        dataset = statsbomb.load(
+            lineup_data=lineup_data, event_data=event_data
+        )
+
+        for event_type in ["pass", "duel", "ball_out", "card", "generic"]:
+            filtered_dataset = statsbomb.load(
+                lineup_data=lineup_data,
+                event_data=event_data,
+                event_types=[event_type],
+            )
+            expected_events = [
+                event
+                for event in dataset.events
+                if event.event_type == EventType[event_type.upper()]
+            ]
+            assert len(expected_events) > 0
+            assert [
+                (event.event_id, event.event_type)
+                for event in filtered_dataset.events
+            ] == [
+                (event.event_id, event.event_type) for event in expected_events
+            ]
+
+    def test_exclude_raw_event(self, lineup_data: Path, event_data: Path):
+        """
+        Test that raw events can be left out, without losing the
+        information that is parsed from them
+        """
+        dataset = statsbomb.load(
+            lineup_data=lineup_data,
+            event_data=event_data,
+            include_raw_event=False,
+        )
+
+        assert len(dataset.events) == 4039
+        assert all(event.raw_event is None for event in dataset.events)
+
+        shot_event = dataset.get_event_by_id(
+            "65f16e50-7c5d-4293-b2fc-d20887a772f9"
+        )
+        assert shot_event.freeze_frame is not None
+
     def test_related_events(self, lineup_data: Path, event_data: Path):
         dataset = statsbomb.load(
             lineup_data=lineup_data, event_data=event_data